@@ -0,0 +1,11 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# The kiosk modules import each other flat (`from models import ...`), as
+# they do when app.py is run from zkbot_controller/, so that directory has
+# to be importable alongside the repo root.
+for path in (ROOT, ROOT / "zkbot_controller"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
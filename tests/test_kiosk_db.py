@@ -0,0 +1,71 @@
+from zkbot_controller.app import KioskDB
+
+
+def test_order_lifecycle(tmp_path):
+    db = KioskDB(str(tmp_path / "kiosk.db"))
+
+    done = db.create_order("Asha", "555", {"mango": 2}, 160)
+    db.complete_order(done)
+    failed = db.create_order("", None, {"orange": 1}, 70)
+    db.fail_order(failed, "robot offline")
+
+    orders = db.get_recent_orders()
+    assert [o["id"] for o in orders] == [failed, done]
+    assert orders[0]["customer_name"] == "Guest"
+    assert orders[0]["status"] == "failed"
+    assert orders[1]["items"] == "Badham Juice x2"
+    assert orders[1]["status"] == "completed"
+
+
+def test_uses_wal_journal(tmp_path):
+    db = KioskDB(str(tmp_path / "kiosk.db"))
+    with db.conn() as con:
+        assert con.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_connection_pragmas(tmp_path):
+    db = KioskDB(str(tmp_path / "kiosk.db"))
+    with db.conn() as con:
+        assert con.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert con.execute("PRAGMA cache_size").fetchone()[0] == -20000
+
+
+def test_failed_write_rolls_back(tmp_path):
+    db = KioskDB(str(tmp_path / "kiosk.db"))
+    try:
+        with db.conn() as con:
+            con.execute("INSERT INTO orders(customer_name) VALUES('Ravi')")
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert db.get_recent_orders() == []
+    db.close()
+
+
+def test_interrupted_write_leaves_db_usable(tmp_path):
+    db = KioskDB(str(tmp_path / "kiosk.db"))
+    try:
+        with db.conn() as con:
+            con.execute("INSERT INTO orders(customer_name) VALUES('Ravi')")
+            raise KeyboardInterrupt
+    except KeyboardInterrupt:
+        pass
+
+    order_id = db.create_order("Asha", "", {"mango": 1}, 80)
+    assert [o["id"] for o in db.get_recent_orders()] == [order_id]
+
+
+def test_create_orders_bulk(tmp_path):
+    db = KioskDB(str(tmp_path / "kiosk.db"))
+    first = db.create_order("Asha", "555", {"mango": 1}, 80)
+
+    ids = db.create_orders_bulk([
+        ("Ravi", "", {"orange": 1}, 70),
+        ("", "", {"mango": 1, "orange": 2}, 220),
+    ])
+
+    assert ids == [first + 1, first + 2]
+    orders = db.get_recent_orders()
+    assert [o["customer_name"] for o in orders] == ["Guest", "Ravi", "Asha"]
+    assert orders[0]["items"] == "Badham Juice x1, Grape Juice x2"
+    assert db.create_orders_bulk([]) == []
@@ -0,0 +1,37 @@
+import math
+from dataclasses import asdict
+
+from zkbot_controller.models import Program, Step
+
+
+def test_step_to_dict_matches_fields():
+    step = Step(cmd="G00", x=1.5, y=None, z=-2.0, do0=90)
+    assert step.to_dict() == asdict(step)
+
+
+def test_program_save_load_round_trip(tmp_path):
+    prog = Program(name="demo")
+    prog.steps.append(Step(cmd="G00", x=-50.0, y=-67.0, z=-110.0, do0=20))
+    prog.steps.append(Step(x=0.0, y=0.0, z=0.0, f=30.0, delay=1.0))
+
+    path = tmp_path / "programs" / "demo.json"
+    prog.save(str(path))
+    loaded = Program.load(str(path))
+
+    assert loaded.name == "demo"
+    assert loaded.steps == prog.steps
+
+
+def test_program_with_nan_round_trips(tmp_path):
+    prog = Program(name="Nimbu ✓")
+    prog.steps.append(Step(x=float("nan"), y=1e-05))
+
+    path = tmp_path / "nan.json"
+    prog.save(str(path))
+    text = path.read_text(encoding="utf-8")
+    assert "NaN" in text and "\\u2713" in text
+
+    loaded = Program.load(str(path))
+    assert loaded.name == "Nimbu ✓"
+    assert math.isnan(loaded.steps[0].x)
+    assert loaded.steps[0].y == 1e-05
@@ -4,14 +4,18 @@
 # Features: Order management, order history database, professional theme, developer interface
 
 import tkinter as tk
-from tkinter import messagebox, ttk
+from tkinter import font as tkfont, messagebox, ttk
 from pathlib import Path
+import hashlib
+import hmac
 import sqlite3
+import threading
+from collections import Counter, deque
 from contextlib import contextmanager
 from datetime import datetime
 
+from background import run_in_background
 from drink_runner import make_drink
-import gui as teach_gui
 
 
 # ---------- Config ----------
@@ -20,9 +24,11 @@ BASE_DIR = Path(__file__).parent
 IMAGES_DIR = BASE_DIR / "images"
 DATA_DIR = BASE_DIR / "data"
 DB_PATH = DATA_DIR / "kiosk.db"
+THUMBS_DIR = DATA_DIR / "thumbs"
 
-OWNER_PASSWORD = "0000"
-DEV_PASSWORD = "0000"
+# SHA-256 hex digests of the access passwords (both "0000" by default)
+OWNER_PASSWORD_HASH = "9af15b336e6a9619928537df30b2e6a2376569fcf9d7e773eccede65606529a0"
+DEV_PASSWORD_HASH = "9af15b336e6a9619928537df30b2e6a2376569fcf9d7e773eccede65606529a0"
 
 # Only juices with program files
 DRINK_CATALOG = {
@@ -51,100 +57,218 @@ THEME = {
     "border": "#E5E7EB",
 }
 
-FONT_TITLE = ("Segoe UI", 16, "bold")
-FONT_BODY = ("Segoe UI", 11)
-FONT_SMALL = ("Segoe UI", 10)
+# Named Tk fonts, created once by register_fonts(). Widgets pass the name,
+# so Tk reuses one font object instead of parsing a tuple per widget.
+FONT_HERO = "KioskHero"
+FONT_HEADING = "KioskHeading"
+FONT_BANNER = "KioskBanner"
+FONT_TITLE = "KioskTitle"
+FONT_SECTION = "KioskSection"
+FONT_TOTAL = "KioskTotal"
+FONT_BUTTON_LARGE = "KioskButtonLarge"
+FONT_BODY_BOLD = "KioskBodyBold"
+FONT_BODY = "KioskBody"
+FONT_BUTTON = "KioskButton"
+FONT_SMALL = "KioskSmall"
+
+FONT_SPECS = {
+    FONT_HERO: ("Segoe UI", 28, "bold"),
+    FONT_HEADING: ("Segoe UI", 24, "bold"),
+    FONT_BANNER: ("Segoe UI", 18, "bold"),
+    FONT_TITLE: ("Segoe UI", 16, "bold"),
+    FONT_SECTION: ("Segoe UI", 14, "bold"),
+    FONT_TOTAL: ("Segoe UI", 13, "bold"),
+    FONT_BUTTON_LARGE: ("Segoe UI", 12, "bold"),
+    FONT_BODY_BOLD: ("Segoe UI", 11, "bold"),
+    FONT_BODY: ("Segoe UI", 11, "normal"),
+    FONT_BUTTON: ("Segoe UI", 10, "bold"),
+    FONT_SMALL: ("Segoe UI", 10, "normal"),
+}
 
 
 # ---------- Database ----------
 
+STATUS_PENDING = "pending"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+# History window icon per order status; anything unknown shows as failed
+STATUS_ICONS = {
+    STATUS_COMPLETED: "✓",
+    STATUS_PENDING: "⏳",
+    STATUS_FAILED: "❌",
+}
+
+
+# Connection settings plus schema, applied in one executescript at startup.
+# journal_mode can't change inside a transaction, so PRAGMAs come first.
+KIOSK_DB_SCHEMA = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-20000;
+
+BEGIN;
+CREATE TABLE IF NOT EXISTS orders(
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    customer_name TEXT,
+    customer_phone TEXT,
+    items TEXT,
+    total_price REAL,
+    status TEXT,
+    created_at TEXT,
+    completed_at TEXT
+);
+COMMIT;
+"""
+
+# Statement text is kept identical across calls so sqlite3's per-connection
+# statement cache reuses the compiled statement instead of re-parsing
+SQL_INSERT_ORDER = """INSERT INTO orders(customer_name, customer_phone, items, total_price, status, created_at)
+VALUES(?, ?, ?, ?, ?, ?)"""
+SQL_COMPLETE_ORDER = "UPDATE orders SET status=?, completed_at=? WHERE id=?"
+SQL_FAIL_ORDER = "UPDATE orders SET status=? WHERE id=?"
+SQL_RECENT_ORDERS = """SELECT id, customer_name, items, total_price, status, created_at
+FROM orders ORDER BY id DESC LIMIT ?"""
+
+
 class KioskDB:
     """SQLite database for order history"""
     def __init__(self, db_path="data/kiosk.db"):
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         self.db_path = db_path
+        # One connection for the life of the kiosk instead of one per call;
+        # the lock keeps it safe if a worker thread ever writes.
+        # Autocommit mode: conn() issues BEGIN/COMMIT itself.
+        self._con = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._con.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
         self._init()
 
     @contextmanager
     def conn(self):
-        con = sqlite3.connect(self.db_path)
-        con.row_factory = sqlite3.Row
-        try:
-            yield con
-            con.commit()
-        except Exception:
-            con.rollback()
-            raise
-        finally:
-            con.close()
+        """Yield the shared connection inside one transaction"""
+        with self._lock:
+            self._con.execute("BEGIN")
+            try:
+                yield self._con
+                self._con.execute("COMMIT")
+            except BaseException:
+                # Never leave the shared connection mid-transaction, or every
+                # later BEGIN fails
+                if self._con.in_transaction:
+                    self._con.execute("ROLLBACK")
+                raise
 
     def _init(self):
-        with self.conn() as con:
-            con.execute("""
-            CREATE TABLE IF NOT EXISTS orders(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                customer_name TEXT,
-                customer_phone TEXT,
-                items TEXT,
-                total_price REAL,
-                status TEXT,
-                created_at TEXT,
-                completed_at TEXT
-            )
-            """)
+        # Not through conn(): journal_mode can't change inside a transaction
+        with self._lock:
+            self._con.executescript(KIOSK_DB_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._con.close()
 
     def create_order(self, customer_name, customer_phone, items_dict, total_price):
         """items_dict = {juice_key: quantity}"""
-        items_str = ", ".join([f"{DRINK_CATALOG[k]['label']} x{v}" for k, v in items_dict.items()])
+        return self.create_orders_bulk([(customer_name, customer_phone, items_dict, total_price)])[0]
+
+    def create_orders_bulk(self, orders):
+        """Insert (customer_name, customer_phone, items_dict, total_price) tuples
+        in one transaction; returns the new order ids in the same order"""
         created_at = datetime.now().isoformat(timespec="seconds")
-        
-        with self.conn() as con:
-            cur = con.cursor()
-            cur.execute(
-                """INSERT INTO orders(customer_name, customer_phone, items, total_price, status, created_at)
-                   VALUES(?, ?, ?, ?, ?, ?)""",
-                (customer_name or "Guest", customer_phone or "", items_str, total_price, "pending", created_at)
+        rows = [
+            (
+                customer_name or "Guest",
+                customer_phone or "",
+                ", ".join([f"{DRINK_CATALOG[k]['label']} x{v}" for k, v in items_dict.items()]),
+                total_price,
+                STATUS_PENDING,
+                created_at,
             )
-            return cur.lastrowid
+            for customer_name, customer_phone, items_dict, total_price in orders
+        ]
+        if not rows:
+            return []
+
+        with self.conn() as con:
+            con.executemany(SQL_INSERT_ORDER, rows)
+            # One writer inside one transaction, so the new ids are contiguous
+            last_id = con.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return list(range(last_id - len(rows) + 1, last_id + 1))
 
     def complete_order(self, order_id):
         completed_at = datetime.now().isoformat(timespec="seconds")
         with self.conn() as con:
-            con.execute(
-                "UPDATE orders SET status=?, completed_at=? WHERE id=?",
-                ("completed", completed_at, order_id)
-            )
+            con.execute(SQL_COMPLETE_ORDER, (STATUS_COMPLETED, completed_at, order_id))
 
     def get_recent_orders(self, limit=50):
+        """Newest first, as sqlite3.Row objects (index by column name)"""
         with self.conn() as con:
-            rows = con.execute(
-                "SELECT * FROM orders ORDER BY id DESC LIMIT ?", (limit,)
-            ).fetchall()
-            return [dict(r) for r in rows]
+            return con.execute(SQL_RECENT_ORDERS, (limit,)).fetchall()
 
     def fail_order(self, order_id, error_msg):
         with self.conn() as con:
-            con.execute(
-                "UPDATE orders SET status=? WHERE id=?",
-                ("failed", order_id)
-            )
+            con.execute(SQL_FAIL_ORDER, (STATUS_FAILED, order_id))
 
 
 # ---------- Utility ----------
 
+def register_fonts(root):
+    """Create the named fonts in FONT_SPECS; the caller must keep the result alive"""
+    return {
+        name: tkfont.Font(root=root, name=name, family=family, size=size, weight=weight)
+        for name, (family, size, weight) in FONT_SPECS.items()
+    }
+
+
+def check_password(entered: str, expected_hash: str) -> bool:
+    """Compare a typed password against a stored SHA-256 digest in constant time"""
+    digest = hashlib.sha256(entered.encode("utf-8")).hexdigest()
+    return hmac.compare_digest(digest, expected_hash)
+
+
+def _load_resized(src: Path, size):
+    """Decoded and resized PIL image.
+
+    The resized copy is also written to THUMBS_DIR, so later launches load a
+    small PNG instead of decoding and resampling the full-size source.
+    """
+    from PIL import Image
+
+    thumb = THUMBS_DIR / f"{src.stem}_{size[0]}x{size[1]}.png"
+    try:
+        if thumb.stat().st_mtime >= src.stat().st_mtime:
+            img = Image.open(thumb)
+            img.load()
+            return img
+    except OSError:
+        pass
+
+    img = Image.open(src)
+    if img.format == "JPEG":
+        # Let libjpeg decode at 1/2..1/8 scale, still no smaller than size
+        img.draft("RGB", size)
+    img = img.resize(size, Image.LANCZOS)
+    try:
+        THUMBS_DIR.mkdir(parents=True, exist_ok=True)
+        img.save(thumb)
+    except OSError:
+        pass  # read-only install: still works, just without the disk cache
+    return img
+
+
 def load_image(path: Path, size=(100, 100)):
     """Load image from path, return PhotoImage or None"""
     try:
-        from PIL import Image, ImageTk
+        from PIL import ImageTk
     except ImportError:
         return None
 
     if not path.exists():
         return None
 
-    img = Image.open(path)
-    img = img.resize(size, Image.LANCZOS)
-    return ImageTk.PhotoImage(img)
+    return ImageTk.PhotoImage(_load_resized(path, size))
 
 
 # ---------- UI Screens ----------
@@ -159,7 +283,7 @@ class OwnerLoginPage(tk.Frame):
         frame = tk.Frame(self, bg=THEME["bg"])
         frame.pack(fill="both", expand=True, padx=40, pady=60)
 
-        tk.Label(frame, text="🍹 ZKBot Juice Kiosk", font=("Segoe UI", 28, "bold"),
+        tk.Label(frame, text="🍹 ZKBot Juice Kiosk", font=FONT_HERO,
                  bg=THEME["bg"], fg=THEME["brand"]).pack(pady=20)
 
         tk.Label(frame, text="Owner Access Required", font=FONT_TITLE,
@@ -176,22 +300,33 @@ class OwnerLoginPage(tk.Frame):
                   bg=THEME["brand"], fg="white", padx=40, pady=10, relief="flat").pack(pady=20)
 
     def _login(self):
-        if self.entry.get() == OWNER_PASSWORD:
+        if check_password(self.entry.get(), OWNER_PASSWORD_HASH):
             self.on_success()
         else:
             messagebox.showerror("Access Denied", "Incorrect password")
             self.entry.delete(0, tk.END)
 
+    def on_show(self):
+        self.entry.delete(0, tk.END)
+        self.entry.focus_set()
+
+
+CART_REFRESH_MS = 50
+
 
 class CustomerPage(tk.Frame):
     def __init__(self, master, on_open_dev, db: KioskDB):
         super().__init__(master, bg=THEME["bg"])
         self.on_open_dev = on_open_dev
         self.db = db
-        self.order = []          # list of juice keys
+        self.order = deque()     # juice keys, made front to back
+        self.total = 0           # running cart total, kept in step with self.order
         self.order_id = None     # current order ID in DB
         self.images = {}
         self.is_running = False
+        self._cart_rows = []     # listbox lines as last drawn
+        self._total_text = None  # total label text as last drawn
+        self._cart_refresh_id = None  # pending after() token for the cart redraw
         self._build()
 
     def _build(self):
@@ -200,16 +335,16 @@ class CustomerPage(tk.Frame):
         top.pack(fill="x")
         top.pack_propagate(False)
 
-        tk.Label(top, text="🍹 ZKBot Juice Station", font=("Segoe UI", 18, "bold"),
+        tk.Label(top, text="🍹 ZKBot Juice Station", font=FONT_BANNER,
                  bg=THEME["brand"], fg="white").pack(side="left", padx=18, pady=10)
 
         tk.Button(top, text="Order History", command=self._show_history,
                   bg="white", fg=THEME["brand"], relief="flat",
-                  font=("Segoe UI", 10, "bold"), padx=14, pady=8).pack(side="right", padx=8)
+                  font=FONT_BUTTON, padx=14, pady=8).pack(side="right", padx=8)
 
-        tk.Button(top, text="Developer", command=self.on_open_dev,
+        tk.Button(top, text="Developer", command=self._open_dev,
                   bg="white", fg=THEME["brand"], relief="flat",
-                  font=("Segoe UI", 10, "bold"), padx=14, pady=8).pack(side="right", padx=8)
+                  font=FONT_BUTTON, padx=14, pady=8).pack(side="right", padx=8)
 
         # Main content
         main = tk.Frame(self, bg=THEME["bg"])
@@ -244,17 +379,17 @@ class CustomerPage(tk.Frame):
                 self.images[key] = img
                 tk.Label(card, image=img, bg=THEME["panel"]).pack(pady=(12, 6))
             else:
-                tk.Label(card, text=info["label"], font=("Segoe UI", 11, "bold"),
+                tk.Label(card, text=info["label"], font=FONT_BODY_BOLD,
                         bg=THEME["panel"]).pack(pady=30)
 
-            tk.Label(card, text=info["label"], font=("Segoe UI", 11, "bold"),
+            tk.Label(card, text=info["label"], font=FONT_BODY_BOLD,
                     bg=THEME["panel"], fg=THEME["text"]).pack()
-            tk.Label(card, text=f"₹{info['price']}", font=("Segoe UI", 11, "bold"),
+            tk.Label(card, text=f"₹{info['price']}", font=FONT_BODY_BOLD,
                     bg=THEME["panel"], fg=THEME["success"]).pack(pady=(2, 8))
 
             tk.Button(card, text="Add", command=lambda k=key: self.add_to_order(k),
                      bg=THEME["brand2"], fg="white", relief="flat",
-                     font=("Segoe UI", 10, "bold"), padx=8, pady=6).pack(padx=10, pady=(0, 10), fill="x")
+                     font=FONT_BUTTON, padx=8, pady=6).pack(padx=10, pady=(0, 10), fill="x")
 
             col += 1
             if col >= 2:
@@ -265,7 +400,7 @@ class CustomerPage(tk.Frame):
         grid.grid_columnconfigure(1, weight=1)
 
     def _build_cart(self, parent):
-        tk.Label(parent, text="Your Cart", font=("Segoe UI", 14, "bold"),
+        tk.Label(parent, text="Your Cart", font=FONT_SECTION,
                 bg=THEME["panel"], fg=THEME["text"]).pack(pady=(14, 6))
 
         self.listbox = tk.Listbox(parent, height=10, font=FONT_SMALL, bd=0,
@@ -284,48 +419,81 @@ class CustomerPage(tk.Frame):
         tk.Entry(parent, textvariable=self.phone_var, font=FONT_BODY).pack(padx=12, pady=(0, 6), fill="x")
 
         # Total
-        self.total_label = tk.Label(parent, text="Total: ₹0", font=("Segoe UI", 13, "bold"),
+        self.total_label = tk.Label(parent, text="Total: ₹0", font=FONT_TOTAL,
                                    bg=THEME["panel"], fg=THEME["text"])
         self.total_label.pack(padx=12, anchor="w", pady=(0, 10))
 
         # Buttons
         tk.Button(parent, text="Clear order", command=self.clear_order,
                  bg=THEME["danger"], fg="white", relief="flat",
-                 font=("Segoe UI", 11, "bold"), pady=10).pack(padx=12, pady=(0, 8), fill="x")
+                 font=FONT_BODY_BOLD, pady=10).pack(padx=12, pady=(0, 8), fill="x")
 
         self.start_btn = tk.Button(parent, text="Start making", command=self.start_order,
                                   bg=THEME["success"], fg="white", relief="flat",
-                                  font=("Segoe UI", 12, "bold"), pady=12)
+                                  font=FONT_BUTTON_LARGE, pady=12)
         self.start_btn.pack(padx=12, pady=(0, 10), fill="x")
 
         ttk.Separator(parent).pack(fill="x", padx=12, pady=10)
 
         self.status_var = tk.StringVar(value="Idle")
         tk.Label(parent, textvariable=self.status_var, bg=THEME["panel"], 
-                fg=THEME["brand2"], font=("Segoe UI", 10), wraplength=340).pack(padx=12, anchor="w", pady=(0, 12))
+                fg=THEME["brand2"], font=FONT_SMALL, wraplength=340).pack(padx=12, anchor="w", pady=(0, 12))
+
+    def _open_dev(self):
+        # The robot is busy; a developer test would fight over the serial port
+        if self.is_running:
+            return
+        self.on_open_dev()
 
     def add_to_order(self, juice_key: str):
         if self.is_running:
             return
         self.order.append(juice_key)
-        self._refresh_cart()
+        self.total += DRINK_CATALOG.get(juice_key, {}).get("price", 0)
+        self._schedule_cart_refresh()
 
     def clear_order(self):
         if self.is_running:
             return
         self.order.clear()
-        self._refresh_cart()
+        self.total = 0
+        self._schedule_cart_refresh()
+
+    def _schedule_cart_refresh(self):
+        """Coalesce a burst of cart changes (rapid taps) into one redraw"""
+        if self._cart_refresh_id is not None:
+            self.after_cancel(self._cart_refresh_id)
+        self._cart_refresh_id = self.after(CART_REFRESH_MS, self._refresh_cart)
 
     def _refresh_cart(self):
-        self.listbox.delete(0, tk.END)
-        total = 0
+        """Redraw only the cart rows and total that changed since last time"""
+        self._cart_refresh_id = None
+        rows = []
         for idx, key in enumerate(self.order, start=1):
             info = DRINK_CATALOG.get(key, {})
             label = info.get("label", key)
             price = info.get("price", 0)
-            total += price
-            self.listbox.insert(tk.END, f"{idx}. {label} (₹{price})")
-        self.total_label.config(text=f"Total: ₹{total}")
+            rows.append(f"{idx}. {label} (₹{price})")
+
+        # Keep the unchanged leading rows and replace everything after them
+        # in at most two Tcl calls. Rows carry their position number, so
+        # popping the first drink renumbers (and replaces) the whole list.
+        shown = self._cart_rows
+        keep = 0
+        for old, text in zip(shown, rows):
+            if old != text:
+                break
+            keep += 1
+        if keep < len(shown):
+            self.listbox.delete(keep, tk.END)
+        if keep < len(rows):
+            self.listbox.insert(tk.END, *rows[keep:])
+        self._cart_rows = rows
+
+        total_text = f"Total: ₹{self.total}"
+        if total_text != self._total_text:
+            self.total_label.config(text=total_text)
+            self._total_text = total_text
 
     def start_order(self):
         if self.is_running:
@@ -335,11 +503,9 @@ class CustomerPage(tk.Frame):
             return
 
         # Collect order items
-        items_dict = {}
-        for key in self.order:
-            items_dict[key] = items_dict.get(key, 0) + 1
+        items_dict = Counter(self.order)
 
-        total = sum(DRINK_CATALOG[k]["price"] * v for k, v in items_dict.items())
+        total = self.total
         name = self.name_var.get().strip() or "Guest"
         phone = self.phone_var.get().strip() or ""
 
@@ -352,7 +518,7 @@ class CustomerPage(tk.Frame):
         self._process_next_drink()
 
     def _process_next_drink(self):
-        """Process drinks one by one on main thread"""
+        """Process drinks one by one; the robot runs on a worker thread"""
         if not self.order:
             # All done
             self.db.complete_order(self.order_id)
@@ -360,30 +526,34 @@ class CustomerPage(tk.Frame):
             self.start_btn.config(state="normal")
             self.status_var.set("✓ Order complete!")
             self.order.clear()
+            self.total = 0
             self._refresh_cart()
             messagebox.showinfo("Success", "Your order is ready. Enjoy!")
             return
 
-        juice_key = self.order.pop(0)
+        juice_key = self.order.popleft()
         info = DRINK_CATALOG.get(juice_key, {})
+        self.total -= info.get("price", 0)
         name = info.get("label", juice_key)
 
         self.status_var.set(f"Making: {name}...")
+        run_in_background(self, lambda: make_drink(juice_key),
+                          lambda error: self._on_drink_done(name, error))
 
-        try:
-            make_drink(juice_key)  # Main thread call
+    def _on_drink_done(self, name, error):
+        if error is None:
             self.status_var.set(f"✓ {name}")
             self._refresh_cart()
             self.after(1000, self._process_next_drink)
+            return
 
-        except Exception as e:
-            self.db.fail_order(self.order_id, str(e))
-            self.is_running = False
-            self.start_btn.config(state="normal")
-            self.status_var.set(f"❌ Error")
-            messagebox.showerror("Robot Error", 
-                f"Failed to make {name}:\n{e}\n\n" +
-                "Check:\n1. Robot is powered ON\n2. USB connected\n3. COM port correct")
+        self.db.fail_order(self.order_id, str(error))
+        self.is_running = False
+        self.start_btn.config(state="normal")
+        self.status_var.set(f"❌ Error")
+        messagebox.showerror("Robot Error", 
+            f"Failed to make {name}:\n{error}\n\n" +
+            "Check:\n1. Robot is powered ON\n2. USB connected\n3. COM port correct")
 
     def _show_history(self):
         """Show order history window"""
@@ -396,7 +566,6 @@ class CustomerPage(tk.Frame):
         # Create treeview
         tree = ttk.Treeview(history_window, columns=("ID", "Name", "Items", "Total", "Status", "Time"), 
                            height=20)
-        tree.pack(fill="both", expand=True, padx=10, pady=10)
 
         tree.column("#0", width=0, stretch=tk.NO)
         tree.column("ID", anchor=tk.W, width=40)
@@ -417,7 +586,7 @@ class CustomerPage(tk.Frame):
         # Populate data
         orders = self.db.get_recent_orders()
         for order in orders:
-            status_icon = "✓" if order["status"] == "completed" else "⏳" if order["status"] == "pending" else "❌"
+            status_icon = STATUS_ICONS.get(order["status"], STATUS_ICONS[STATUS_FAILED])
             tree.insert("", tk.END, values=(
                 order["id"],
                 order["customer_name"],
@@ -427,6 +596,9 @@ class CustomerPage(tk.Frame):
                 order["created_at"]
             ))
 
+        # Map the tree only once it is full, so the rows lay out in one pass
+        tree.pack(fill="both", expand=True, padx=10, pady=10)
+
 
 class DeveloperLoginPage(tk.Frame):
     def __init__(self, master, on_success, on_back):
@@ -439,7 +611,7 @@ class DeveloperLoginPage(tk.Frame):
         frame = tk.Frame(self, bg=THEME["bg"])
         frame.pack(fill="both", expand=True, padx=40, pady=60)
 
-        tk.Label(frame, text="Developer Access", font=("Segoe UI", 24, "bold"),
+        tk.Label(frame, text="Developer Access", font=FONT_HEADING,
                 bg=THEME["bg"], fg=THEME["brand"]).pack(pady=20)
 
         tk.Label(frame, text="Password:", font=FONT_BODY,
@@ -458,17 +630,22 @@ class DeveloperLoginPage(tk.Frame):
                  bg=THEME["brand"], fg="white", padx=20, pady=8, relief="flat").pack(side="left", padx=5)
 
     def _login(self):
-        if self.entry.get() == DEV_PASSWORD:
+        if check_password(self.entry.get(), DEV_PASSWORD_HASH):
             self.on_success()
         else:
             messagebox.showerror("Access Denied", "Incorrect password")
             self.entry.delete(0, tk.END)
 
+    def on_show(self):
+        self.entry.delete(0, tk.END)
+        self.entry.focus_set()
+
 
 class DeveloperPage(tk.Frame):
     def __init__(self, master, on_back):
         super().__init__(master, bg=THEME["bg"])
         self.on_back = on_back
+        self.is_running = False
         self._build()
 
     def _build(self):
@@ -476,11 +653,11 @@ class DeveloperPage(tk.Frame):
         top.pack(fill="x")
         top.pack_propagate(False)
 
-        tk.Label(top, text="⚙️ Developer / Maintenance", font=("Segoe UI", 18, "bold"),
+        tk.Label(top, text="⚙️ Developer / Maintenance", font=FONT_BANNER,
                 bg=THEME["brand"], fg="white").pack(side="left", padx=18, pady=10)
 
-        tk.Button(top, text="Back", command=self.on_back, bg="white", 
-                 fg=THEME["brand"], relief="flat", font=("Segoe UI", 10, "bold"), 
+        tk.Button(top, text="Back", command=self._back, bg="white", 
+                 fg=THEME["brand"], relief="flat", font=FONT_BUTTON, 
                  padx=14, pady=8).pack(side="right", padx=8)
 
         main = tk.Frame(self, bg=THEME["bg"])
@@ -506,19 +683,35 @@ class DeveloperPage(tk.Frame):
                 bg=THEME["bg"], fg=THEME["brand2"], wraplength=500).pack(pady=20)
 
     def _open_teach_gui(self):
+        # Imported on demand: the teaching GUI is a maintenance tool most
+        # kiosk sessions never open
+        import gui as teach_gui
+
         top = tk.Toplevel(self)
         top.title("Teaching GUI")
         teach_gui.main(top)
 
+    def _back(self):
+        # Stay here until the robot is free so the kiosk can't start an order
+        if self.is_running:
+            return
+        self.on_back()
+
     def _test_drink(self, key):
-        try:
-            self.status_var.set(f"Testing {key}... (DO NOT STOP)")
-            self.update()
-            make_drink(key)
+        if self.is_running:
+            return
+        self.is_running = True
+        self.status_var.set(f"Testing {key}... (DO NOT STOP)")
+        run_in_background(self, lambda: make_drink(key),
+                          lambda error: self._on_test_done(key, error))
+
+    def _on_test_done(self, key, error):
+        self.is_running = False
+        if error is None:
             self.status_var.set(f"✓ Test complete: {key}")
-        except Exception as e:
-            self.status_var.set(f"❌ Error: {e}")
-            messagebox.showerror("Error", str(e))
+        else:
+            self.status_var.set(f"❌ Error: {error}")
+            messagebox.showerror("Error", str(error))
 
 
 # ---------- Main App ----------
@@ -529,25 +722,44 @@ class MainApp(tk.Tk):
         self.title("🍹 ZKBot Juice Kiosk")
         self.geometry("1000x650")
         self.configure(bg=THEME["bg"])
+        self.fonts = register_fonts(self)
 
-        self.db = KioskDB(str(DB_PATH))
+        # Opened on the first visit to the customer page, so the login
+        # screen paints without waiting on SQLite
+        self.db = None
 
         self.container = tk.Frame(self, bg=THEME["bg"])
         self.container.pack(fill="both", expand=True)
+        self.container.grid_rowconfigure(0, weight=1)
+        self.container.grid_columnconfigure(0, weight=1)
 
+        # Pages stay alive once built; switching only maps/unmaps them
+        self.pages = {}
         self.current_frame = None
         self.show_owner_login()
 
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
     def _switch_to(self, frame_class, *args, **kwargs):
-        if self.current_frame is not None:
-            self.current_frame.destroy()
-        self.current_frame = frame_class(self.container, *args, **kwargs)
-        self.current_frame.pack(fill="both", expand=True)
+        """Show the page for frame_class, building it on first use"""
+        page = self.pages.get(frame_class)
+        if page is None:
+            page = frame_class(self.container, *args, **kwargs)
+            self.pages[frame_class] = page
+        elif hasattr(page, "on_show"):
+            page.on_show()
+
+        if self.current_frame is not None and self.current_frame is not page:
+            self.current_frame.grid_remove()
+        page.grid(row=0, column=0, sticky="nsew")
+        self.current_frame = page
 
     def show_owner_login(self):
         self._switch_to(OwnerLoginPage, self.show_customer)
 
     def show_customer(self):
+        if self.db is None:
+            self.db = KioskDB(str(DB_PATH))
         self._switch_to(CustomerPage, self.show_dev_login, self.db)
 
     def show_dev_login(self):
@@ -556,6 +768,21 @@ class MainApp(tk.Tk):
     def show_developer(self):
         self._switch_to(DeveloperPage, self.show_customer)
 
+    def _on_close(self):
+        # Exiting kills the daemon drink thread mid-move: the serial port is
+        # never closed and the order stays pending. Pages can't be left
+        # while they run, so only the visible one needs checking.
+        if getattr(self.current_frame, "is_running", False):
+            messagebox.showwarning("Robot busy", "Please wait for the current drink to finish.")
+            return
+        self.destroy()
+
+    def destroy(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+        super().destroy()
+
 
 if __name__ == "__main__":
     app = MainApp()
@@ -0,0 +1,38 @@
+# background.py
+#
+# Runs blocking robot jobs off the Tk thread, shared by the kiosk (app.py)
+# and the teaching GUI (gui.py)
+
+import queue
+import threading
+
+
+WORKER_POLL_MS = 100
+
+
+def run_in_background(widget, func, on_done):
+    """Run func() on a worker thread, then call on_done(error) on the Tk thread.
+
+    error is None on success. Tk is only touched from the main loop, which
+    polls the worker's result with widget.after().
+    """
+    results = queue.SimpleQueue()
+
+    def worker():
+        try:
+            func()
+        except Exception as e:
+            results.put(e)
+        else:
+            results.put(None)
+
+    def poll():
+        try:
+            error = results.get_nowait()
+        except queue.Empty:
+            widget.after(WORKER_POLL_MS, poll)
+            return
+        on_done(error)
+
+    threading.Thread(target=worker, daemon=True).start()
+    widget.after(WORKER_POLL_MS, poll)
@@ -24,9 +24,7 @@ def make_drink(juice_key: str) -> None:
 
     # Merge steps in order into one Program
     full_prog = Program(name=f"drink_{juice_key}")
-    full_prog.steps.extend(origin_prog.steps)
-    full_prog.steps.extend(common_prog.steps)
-    full_prog.steps.extend(juice_prog.steps)
+    full_prog.steps = origin_prog.steps + common_prog.steps + juice_prog.steps
 
     # Run with your existing serial_comm.run_program
     run_program(full_prog)
@@ -2,9 +2,10 @@
 
 import os
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import ttk, messagebox
 from typing import Optional
 
+from background import run_in_background
 from models import Step, Program
 from serial_comm import run_program
 from config import PROGRAMS_DIR
@@ -19,7 +20,9 @@ class MainWindow(tk.Frame):
 
         self.program = Program("unnamed")
         self.current_path = None
+        self.running = False
         self._build_widgets()
+        self.master.protocol("WM_DELETE_WINDOW", self._on_close)
 
     # ---------- UI building ----------
 
@@ -166,8 +169,7 @@ class MainWindow(tk.Frame):
             return None
 
     def _refresh_tree(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
         for idx, s in enumerate(self.program.steps):
             self.tree.insert(
                 "",
@@ -235,6 +237,8 @@ class MainWindow(tk.Frame):
         self.status_var.set("New program.")
 
     def on_open_program(self):
+        from tkinter import filedialog
+
         os.makedirs(PROGRAMS_DIR, exist_ok=True)
         path = filedialog.askopenfilename(
             initialdir=PROGRAMS_DIR,
@@ -251,6 +255,8 @@ class MainWindow(tk.Frame):
             messagebox.showerror("Open failed", str(e))
 
     def on_save_program(self):
+        from tkinter import filedialog
+
         if not self.current_path:
             os.makedirs(PROGRAMS_DIR, exist_ok=True)
             path = filedialog.asksaveasfilename(
@@ -267,18 +273,36 @@ class MainWindow(tk.Frame):
         except Exception as e:
             messagebox.showerror("Save failed", str(e))
 
+    def _on_close(self):
+        # Exiting kills the daemon run thread mid-move, before run_program
+        # can close the serial port
+        if self.running:
+            messagebox.showwarning("Robot busy", "Please wait for the program to finish.")
+            return
+        self.master.destroy()
+
     def on_run_program(self):
+        if self.running:
+            return
         if not self.program.steps:
             messagebox.showinfo("Run", "Program is empty.")
             return
-        try:
-            self.status_var.set("Running program...")
-            self.master.update_idletasks()
-            run_program(self.program)
+
+        # Run a snapshot so edits made while the robot moves don't race it
+        prog = Program(self.program.name)
+        prog.steps = list(self.program.steps)
+
+        self.running = True
+        self.status_var.set("Running program...")
+        run_in_background(self, lambda: run_program(prog), self._on_run_done)
+
+    def _on_run_done(self, error):
+        self.running = False
+        if error is None:
             self.status_var.set("Finished program.")
-        except Exception as e:
-                messagebox.showerror("Run failed", str(e))
-                self.status_var.set("Error – see message.")
+        else:
+            messagebox.showerror("Run failed", str(error))
+            self.status_var.set("Error – see message.")
     
     
     def main(root=None):
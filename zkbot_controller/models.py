@@ -1,13 +1,22 @@
 # models.py
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import List, Optional
 import json
 import os
+import sys
 from config import PROGRAMS_DIR, DEFAULT_FEED, DEFAULT_DELAY
 
+try:
+    import orjson  # optional: several times faster program load
+except ImportError:
+    orjson = None
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Step:
     cmd: str = "G01"                 # "G00" (point) or "G01" (linear)
     x: Optional[float] = None
@@ -18,18 +27,30 @@ class Step:
     do0: Optional[float] = None      # end-effector angle (for G06), degrees
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Plain literal: asdict() deep-copies and reflects over fields for
+        # what is only a handful of scalars
+        return {
+            "cmd": self.cmd,
+            "x": self.x,
+            "y": self.y,
+            "z": self.z,
+            "f": self.f,
+            "delay": self.delay,
+            "do0": self.do0,
+        }
 
     @staticmethod
     def from_dict(data: dict) -> "Step":
+        # Positional, in field order: this runs once per step on every load
+        get = data.get
         return Step(
-            cmd=data.get("cmd", "G01"),
-            x=data.get("x"),
-            y=data.get("y"),
-            z=data.get("z"),
-            f=data.get("f", DEFAULT_FEED),
-            delay=data.get("delay", DEFAULT_DELAY),
-            do0=data.get("do0"),
+            get("cmd", "G01"),
+            get("x"),
+            get("y"),
+            get("z"),
+            get("f", DEFAULT_FEED),
+            get("delay", DEFAULT_DELAY),
+            get("do0"),
         )
 
 
@@ -47,19 +68,30 @@ class Program:
     @staticmethod
     def from_dict(data: dict) -> "Program":
         prog = Program(name=data.get("name", "unnamed"))
-        for s in data.get("steps", []):
-            prog.steps.append(Step.from_dict(s))
+        prog.steps = [Step.from_dict(s) for s in data.get("steps", [])]
         return prog
 
     # ---- file I/O ----
 
     def save(self, path: str) -> None:
-        os.makedirs(os.path.dirname(path), exist_ok=True)
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        # Always stdlib: orjson writes non-ASCII and floats differently and
+        # turns NaN into null, which would silently drop an axis
         with open(path, "w", encoding="utf-8") as f:
             json.dump(self.to_dict(), f, indent=2)
 
     @staticmethod
     def load(path: str) -> "Program":
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = None
+        if orjson is not None:
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN/Infinity, which stdlib json writes but orjson rejects
+        if data is None:
+            data = json.loads(raw)
         return Program.from_dict(data)